@@ -1,13 +1,35 @@
 import pygame
+import argparse
 import random
 import json
 from datetime import datetime
-from copy import deepcopy
 import math
 import os
+import threading
 import time
 from collections import defaultdict
 
+try:
+    import numpy as np
+    from numba import njit
+    HAVE_NUMBA = True
+except ImportError:  # Numba is optional; the AI falls back to GameState.minimax
+    HAVE_NUMBA = False
+
+    def njit(*args, **kwargs):
+        """Stand-in decorator that leaves the search kernel as plain Python"""
+        if args and callable(args[0]):  # Used bare, as @njit
+            return args[0]
+        return lambda func: func
+
+# Command line options
+parser = argparse.ArgumentParser(description="Number String Game")
+parser.add_argument('--no-tree', action='store_true', help="don't write the game move log")
+parser.add_argument('--seed', type=int, help="seed the board generator so games can be replayed")
+args = parser.parse_args()
+
+rng = random.Random(args.seed)  # Every random draw in the game goes through this
+
 # Initialize pygame
 pygame.init()
 
@@ -15,6 +37,10 @@ pygame.init()
 WIDTH, HEIGHT = 1000, 600
 BUTTON_SIZE = 60
 PADDING = 10
+FPS = 60
+IDLE_FPS = 30  # Used while waiting on a player who is not moving the mouse
+IDLE_AFTER_MS = 1000
+AI_MOVE_DELAY_MS = 500  # Pause before the AI moves so the player can see their own move
 COLORS = {
     'white': (255, 255, 255),
     'black': (0, 0, 0),
@@ -33,170 +59,226 @@ pygame.display.set_caption("Number Merging Game")
 font = pygame.font.Font(None, 36)
 small_font = pygame.font.Font(None, 24)
 
+# Pre-rendered text for labels that do not change between frames
+DIGIT_SURF = {i: font.render(str(i), True, COLORS['white']) for i in range(1, 7)}
+LABEL_REMOVE = font.render("Remove", True, COLORS['white'])
+LABEL_MERGE = font.render("Merge", True, COLORS['white'])
+LABEL_RESTART = font.render("Restart", True, COLORS['white'])
+LABEL_YOUR_TURN = font.render("Your Turn", True, COLORS['green'])
+LABEL_AI_THINKING = font.render("AI Thinking...", True, COLORS['red'])
+mode_labels = {}  # ai_mode -> rendered "AI: <mode>" label
+score_labels = {}  # total_points -> rendered "Points: <n>" label
+last_drawn = {}  # Screen region -> the state it was last drawn from
+button_spacing = BUTTON_SIZE  # Distance between number buttons as last drawn
+
 ai_mode = 'minimax'  # Default AI mode
+SEARCH_DEPTH = 5  # Minimax depth for long boards
+SEARCH_TIME_LIMIT = 1.0  # Seconds the Python search may spend deepening per AI move
+FULL_SOLVE_LENGTH = 8  # Boards this short are searched to the end of the game
+DEBUG_THOUGHTS = False  # Log every search depth and the heuristic breakdown, not just a summary
+
+# The board is packed into one int, 3 bits per number, position 0 lowest
+MAX_LENGTH = 25
+LANE_BITS = 3
+LANE_MASK = 0b111
+ODD_MASK = sum(1 << (LANE_BITS * i) for i in range(MAX_LENGTH))  # Lowest bit of each lane
 
-class GameNode:
-    """Class to represent nodes in the game tree"""
-    def __init__(self, move=None, state=None, parent=None):
-        self.move = move  # (action, index)
-        self.state = state  # GameState snapshot
-        self.parent = parent
-        self.children = []
-        self.depth = parent.depth + 1 if parent else 0
-        self.heuristic = 0
-
-    def to_dict(self):
-        """Convert node to dictionary for storage"""
-        return {
-            'move': self.move,
-            'state': {
-                'numbers': self.state.numbers_list if self.state else [],
-                'points': self.state.total_points if self.state else 0,
-                'winner': self.state.winner if self.state else None
-            },
-            'heuristic': self.heuristic,
-            'depth': self.depth,
-            'children_count': len(self.children)
-        }
+# MERGE[a][b] is the merged value of a and b (7=1, 8=2, etc.)
+MERGE = tuple(tuple(((a + b - 1) % 6) + 1 for b in range(7)) for a in range(7))
+
+# MOVES_BY_LENGTH[n] lists every move on a board of n numbers: all merges, then all removes
+MOVES_BY_LENGTH = tuple(tuple([("merge", i) for i in range(n - 1)] + [("remove", i) for i in range(n)])
+                        for n in range(MAX_LENGTH + 1))
+
+# Transposition table: (bits, total_points, maximizing_player) -> (depth, value, best_move, flag)
+TT = {}
+TT_EXACT, TT_LOWER, TT_UPPER = 0, 1, 2
+TT_MAX_ENTRIES = 1 << 18  # Cleared when full, keeping it to a few tens of MB
+
+class SearchTimeout(Exception):
+    """Raised inside minimax once the AI's time budget is used up"""
 
 class GameTree:
-    """Class to manage the game tree storage"""
-    def __init__(self):
-        self.root = None
-        self.current_node = None
+    """Class to manage the game move log storage"""
+    def __init__(self, enabled=True):
+        self.enabled = enabled  # When False, nothing is logged or written
+        self.log = None
         self.game_id = None
         self.initial_state_hash = None
     
     def start_new_game(self, initial_state):
-        """Initialize tree with starting state"""
+        """Open the move log for a new game"""
+        if not self.enabled:
+            return
+        
         # Create hash of initial state for filename
         self.initial_state_hash = hash(tuple(initial_state.numbers_list))
         self.game_id = f"game_{self.initial_state_hash}"
         
-        # Try to load existing tree
-        filename = f"{self.game_id}.json"
-        try:
-            with open(filename, 'r') as f:
-                tree_data = json.load(f)
-                self.root = self._dict_to_node(tree_data)
-                self.current_node = self.root
-                print(f"Loaded existing game tree from {filename}")
-        except (FileNotFoundError, json.JSONDecodeError):
-            self.root = GameNode(state=initial_state.clone())
-            self.current_node = self.root
-            print(f"Created new game tree {filename}")
-
-    def _dict_to_node(self, node_dict):
-        """Recursively convert dictionary to node"""
-        if not node_dict:
-            return None
-            
-        node = GameNode(
-            move=node_dict['move'],
-            state=GameState(
-                node_dict['state']['points'],
-                node_dict['state']['numbers']
-            ),
-            parent=None
-        )
-        node.heuristic = node_dict['heuristic']
-        node.depth = node_dict['depth']
-        
-        # Rebuild children recursively
-        node.children = [self._dict_to_node(child) for child in node_dict['children']]
-        for child in node.children:
-            child.parent = node
-            
-        return node
+        # Moves are appended one JSON object per line
+        filename = f"{self.game_id}.jsonl"
+        self.log = open(filename, 'a')
+        self.add_node(None, initial_state)
+        print(f"Logging game moves to {filename}")
 
     def add_node(self, move, state):
-        """Add a new node to the tree"""
-        if not self.current_node:
+        """Append a move and the resulting state to the log"""
+        if not self.enabled or not self.log:
             return
         
-        new_node = GameNode(move=move, state=state.clone(), parent=self.current_node)
-        self.current_node.children.append(new_node)
-        self.current_node = new_node
+        self.log.write(json.dumps({
+            'move': move,
+            'numbers': state.numbers_list,
+            'points': state.total_points
+        }) + '\n')
+        if state.winner:
+            self.log.flush()
     
     def save_tree(self):
-        """Save the game tree to a JSON file"""
-        if not self.root:
+        """Close the move log"""
+        if not self.enabled or not self.log:
             return
         
-        filename = f"{self.game_id}.json"
-        tree_dict = self._node_to_dict(self.root)
-        
-        with open(filename, 'w') as f:
-            json.dump(tree_dict, f, indent=2)
-        print(f"Game tree saved to {filename}")
-    
-    def _node_to_dict(self, node):
-        """Recursively convert tree to dictionary"""
-        if not node:
-            return None
-        
-        node_dict = node.to_dict()
-        node_dict['children'] = [self._node_to_dict(child) for child in node.children]
-        return node_dict
+        self.log.close()
+        self.log = None
+        print(f"Game log saved to {self.game_id}.jsonl")
 
 class GameState:
+    __slots__ = ('total_points', 'bits', 'n', 'last_ai_move', 'winner', 'last_move',
+                 'ai_thoughts', 'starting_player', '_log_thoughts', '_deadline')
+
     def __init__(self, total_points, numbers_list):
         self.total_points = total_points
-        self.numbers_list = numbers_list
+        self.bits = 0
+        for i, num in enumerate(numbers_list):
+            self.bits |= num << (LANE_BITS * i)
+        self.n = len(numbers_list)
         self.last_ai_move = None
         self.winner = None
-        self.last_move_details = []
+        self.last_move = None  # Undo token of the last move made with make_move
         self.ai_thoughts = []
         self.starting_player = 1  # 1 for human, 2 for AI
+        self._log_thoughts = False  # Only annotate evaluations outside the search
+        self._deadline = math.inf  # perf_counter() time at which minimax gives up
+
+    @property
+    def numbers_list(self):
+        """Unpack the board into a list of numbers."""
+        bits = self.bits
+        numbers = []
+        for _ in range(self.n):
+            numbers.append(bits & LANE_MASK)
+            bits >>= LANE_BITS
+        return numbers
+
+    def get(self, index):
+        """Return the number at position index."""
+        return (self.bits >> (LANE_BITS * index)) & LANE_MASK
+
+    def count_odd(self):
+        """Count the odd numbers on the board (the low bit of each lane)."""
+        return (self.bits & ODD_MASK).bit_count()
 
     def clone(self):
-        """Create a deep copy of the current state."""
-        new_state = GameState(self.total_points, self.numbers_list.copy())
+        """Create a copy of the current state (UI history is not copied)."""
+        new_state = GameState.__new__(GameState)
+        new_state.total_points = self.total_points
+        new_state.bits = self.bits  # The whole board is one immutable int
+        new_state.n = self.n
         new_state.winner = self.winner
         new_state.starting_player = self.starting_player
+        new_state.last_ai_move = None
+        new_state.last_move = None
+        new_state.ai_thoughts = []
+        new_state._log_thoughts = False
+        new_state._deadline = math.inf
         return new_state
 
+    def snapshot(self):
+        """Return the position as an immutable, hashable (bits, n, total_points) tuple."""
+        return (self.bits, self.n, self.total_points)
+
+    def restore(self, snapshot):
+        """Return to a position taken with snapshot()."""
+        self.bits, self.n, self.total_points = snapshot
+
     def make_move(self, index, move_type):
         """Execute a move and return a description."""
         if self.winner:
             return None
 
-        description = ""
-        details = []
-        if move_type == "merge" and index < len(self.numbers_list) - 1:
-            num1, num2 = self.numbers_list[index], self.numbers_list[index + 1]
-            new_sum = (num1 + num2) % 6 or 6  # Handles wrap-around (7=1, 8=2, etc.)
-            self.numbers_list[index] = new_sum
-            del self.numbers_list[index + 1]
-            self.total_points += 1
-            description = f"Merged {num1}+{num2}→{new_sum} at {index}"
-            details = [
+        token = self.do_move(index, move_type)
+        self.check_winner()
+        self.last_move = token  # Spelled out by move_details() when it is shown
+        if token is None:
+            return ""
+        if token[0] == "merge":
+            return f"Merged {token[2]}+{token[3]}→{self.get(index)} at {index}"
+        return f"Removed {token[2]} at {index}"
+
+    def move_details(self):
+        """Describe the last move made with make_move, one line per fact."""
+        token = self.last_move
+        if token is None:
+            return []
+        index, points = token[1], token[-1]
+        if token[0] == "merge":
+            num1, num2 = token[2], token[3]
+            return [
                 f"Position: {index}",
                 f"Numbers: {num1} and {num2}",
-                f"New value: {new_sum}",
+                f"New value: {MERGE[num1][num2]}",
                 f"Points gained: +1",
-                f"Total points: {self.total_points}"
+                f"Total points: {points + 1}"
             ]
+        return [
+            f"Position: {index}",
+            f"Number removed: {token[2]}",
+            f"Points lost: -1",
+            f"Total points: {points - 1}"
+        ]
+
+    def do_move(self, index, move_type):
+        """Apply a move in place and return an undo token (None if invalid).
+
+        The winner is not updated here; search code treats n == 1 as terminal.
+        """
+        bits = self.bits
+        prev = (bits, self.total_points)
+        shift = LANE_BITS * index
+        low = bits & ((1 << shift) - 1)  # Numbers before index stay in place
+        if move_type == "merge" and index < self.n - 1:
+            num1 = (bits >> shift) & LANE_MASK
+            num2 = (bits >> (shift + LANE_BITS)) & LANE_MASK
+            new_sum = MERGE[num1][num2]
+            tail = bits >> (shift + 2 * LANE_BITS)
+            self.bits = low | (new_sum << shift) | (tail << (shift + LANE_BITS))
+            self.n -= 1
+            self.total_points += 1
+            token = ("merge", index, num1, num2) + prev
         
-        elif move_type == "remove" and index < len(self.numbers_list):
-            removed = self.numbers_list.pop(index)
+        elif move_type == "remove" and index < self.n:
+            removed = (bits >> shift) & LANE_MASK
+            tail = bits >> (shift + LANE_BITS)
+            self.bits = low | (tail << shift)
+            self.n -= 1
             self.total_points -= 1
-            description = f"Removed {removed} at {index}"
-            details = [
-                f"Position: {index}",
-                f"Number removed: {removed}",
-                f"Points lost: -1",
-                f"Total points: {self.total_points}"
-            ]
+            token = ("remove", index, removed) + prev
         
-        self.check_winner()
-        self.last_move_details = details
-        return description
+        else:
+            return None
+        
+        return token
+
+    def undo_move(self, token):
+        """Revert a move applied by do_move."""
+        self.bits, self.total_points = token[-2:]
+        self.n += 1
 
     def check_winner(self):
         """Determine the winner when one number remains."""
-        if len(self.numbers_list) == 1:
-            final_num = self.numbers_list[0]
+        if self.n == 1:
+            final_num = self.bits
             if (final_num % 2 == self.total_points % 2):
                 if (final_num % 2 == 0 and self.starting_player == 1) or \
                    (final_num % 2 == 1 and self.starting_player == 2):
@@ -207,75 +289,148 @@ class GameState:
                 self.winner = "It's a Draw!"
 
     def get_possible_moves(self):
-        """Return all valid moves as (move_type, index) pairs."""
-        if self.winner:
-            return []
-        
-        moves = []
-        # All possible merges (can only merge adjacent pairs)
-        for i in range(len(self.numbers_list) - 1):
-            moves.append(("merge", i))
-        
-        # All possible removes
-        for i in range(len(self.numbers_list)):
-            # Prevent removing the last number (game would end)
-            if len(self.numbers_list) > 1:
-                moves.append(("remove", i))
-        
-        return moves
+        """Return all valid moves as a shared tuple of (move_type, index) pairs."""
+        # Prevent removing the last number (game would end)
+        if self.winner or self.n < 2:
+            return ()
+        return MOVES_BY_LENGTH[self.n]
 
     def evaluate_heuristic(self):
-        """Heuristic evaluation of the board state"""
-        self.ai_thoughts = []
+        """Heuristic evaluation of the board state, logging the breakdown if requested"""
         score = 0
         
         # Terminal state evaluation
-        if len(self.numbers_list) == 1:
-            final_num = self.numbers_list[0]
+        if self.n == 1:
+            final_num = self.bits
             if (final_num % 2 == self.total_points % 2):
                 if (final_num % 2 == 0 and self.starting_player == 1) or \
                    (final_num % 2 == 1 and self.starting_player == 2):
                     score += 1000  # AI wins
-                    self.ai_thoughts.append("Terminal state: AI wins!")
+                    if self._log_thoughts:
+                        self.ai_thoughts.append("Terminal state: AI wins!")
                 else:
                     score -= 1000  # Player wins
-                    self.ai_thoughts.append("Terminal state: Player wins!")
+                    if self._log_thoughts:
+                        self.ai_thoughts.append("Terminal state: Player wins!")
             else:
                 score = 0  # Draw
-                self.ai_thoughts.append("Terminal state: Draw")
+                if self._log_thoughts:
+                    self.ai_thoughts.append("Terminal state: Draw")
             return score
         
         # Points score (positive is good for AI)
         score += 2 * self.total_points
-        self.ai_thoughts.append(f"Points score: {2 * self.total_points}")
+        if self._log_thoughts:
+            self.ai_thoughts.append(f"Points score: {2 * self.total_points}")
         
         # Number of possible moves (more options is better)
-        possible_moves = len(self.get_possible_moves())
+        possible_moves = 2 * self.n - 1 if self.n > 1 else 0  # n-1 merges + n removes
         score += 0.5 * possible_moves
-        self.ai_thoughts.append(f"Move options: {0.5 * possible_moves}")
+        if self._log_thoughts:
+            self.ai_thoughts.append(f"Move options: {0.5 * possible_moves}")
         
         # Parity strategy
         current_parity = self.total_points % 2
-        matching_numbers = sum(1 for num in self.numbers_list if num % 2 == current_parity)
+        odd_numbers = self.count_odd()
+        matching_numbers = odd_numbers if current_parity else self.n - odd_numbers
         parity_score = 1.5 * matching_numbers
         score += parity_score
-        self.ai_thoughts.append(f"Parity score: {parity_score} ({matching_numbers} matching)")
-        
-        self.ai_thoughts.append(f"Total heuristic score: {score}")
+        if self._log_thoughts:
+            self.ai_thoughts.append(f"Parity score: {parity_score} ({matching_numbers} matching)")
+            self.ai_thoughts.append(f"Total heuristic score: {score}")
         return score
 
-    def minimax(self, depth, alpha, beta, maximizing_player):
-        """Minimax algorithm with alpha-beta pruning."""
-        if depth == 0 or self.winner:
+    def terminal_score(self, final_num, points):
+        """Heuristic score of a finished game with final_num left and the given points."""
+        if final_num % 2 != points % 2:
+            return 0  # Draw
+        if (final_num % 2 == 0 and self.starting_player == 1) or \
+           (final_num % 2 == 1 and self.starting_player == 2):
+            return 1000  # AI wins
+        return -1000  # Player wins
+
+    def endgame_score(self, maximizing_player):
+        """Solve a board of two or three numbers exactly, returning (score, best_move)."""
+        def pair_outcomes(a, b, points):
+            # Score of each move on the pair (a, b), which all end the game
+            return ((("merge", 0), self.terminal_score(MERGE[a][b], points + 1)),
+                    (("remove", 0), self.terminal_score(b, points - 1)),
+                    (("remove", 1), self.terminal_score(a, points - 1)))
+
+        pick = max if maximizing_player else min
+        points = self.total_points
+        if self.n == 2:
+            a, b = self.numbers_list
+            outcomes = pair_outcomes(a, b, points)
+        else:
+            # Each move leaves a pair, from which the opponent ends the game
+            reply = min if maximizing_player else max
+            a, b, c = self.numbers_list
+            children = ((("merge", 0), MERGE[a][b], c, points + 1),
+                        (("merge", 1), a, MERGE[b][c], points + 1),
+                        (("remove", 0), b, c, points - 1),
+                        (("remove", 1), a, c, points - 1),
+                        (("remove", 2), a, b, points - 1))
+            outcomes = [(move, reply(score for _, score in pair_outcomes(x, y, child_points)))
+                        for move, x, y, child_points in children]
+        best_move, score = pick(outcomes, key=lambda outcome: outcome[1])
+        return score, best_move
+
+    def minimax(self, depth, alpha, beta, maximizing_player, preferred_move=None):
+        """Minimax algorithm with alpha-beta pruning, searching preferred_move first."""
+        if depth == 0 or self.n == 1:
             return self.evaluate_heuristic(), None
+
+        # Two or three numbers left and enough depth to finish: solve it directly
+        if self.n <= 3 and depth >= self.n - 1:
+            return self.endgame_score(maximizing_player)
+
+        # Last ply: no child is terminal, so score them without playing them out
+        if depth == 1 and self.n > 2:
+            score = self.move_scorer()
+            pick = max if maximizing_player else min
+            best_move = pick(self.get_possible_moves(), key=score)
+            base = 2 * self.total_points + 0.5 * (2 * self.n - 3)
+            return base + score(best_move), best_move
+
+        # Depth 1 is cheap and never times out, so there is always a move to play
+        if depth > 1 and time.perf_counter() > self._deadline:
+            raise SearchTimeout
+
+        # Transposition table lookup
+        alpha_orig, beta_orig = alpha, beta
+        tt_key = (self.bits, self.total_points, maximizing_player)
+        entry = TT.get(tt_key)
+        tt_move = None
+        if entry:
+            entry_depth, value, tt_move, flag = entry
+            # A shallower result is only used to pick the first move to try
+            if entry_depth >= depth:
+                if flag == TT_EXACT:
+                    return value, tt_move
+                elif flag == TT_LOWER:
+                    alpha = max(alpha, value)
+                elif flag == TT_UPPER:
+                    beta = min(beta, value)
+                if beta <= alpha:
+                    return value, tt_move
+
+        moves = self.order_moves(self.get_possible_moves(), maximizing_player,
+                                 preferred_move or tt_move)
         
         best_move = None
+        seen = set()  # Children already searched from this node
         if maximizing_player:
             max_eval = -math.inf
-            for move in self.get_possible_moves():
-                new_state = self.clone()
-                new_state.make_move(move[1], move[0])
-                evaluation, _ = new_state.minimax(depth-1, alpha, beta, False)
+            for move in moves:
+                token = self.do_move(move[1], move[0])
+                child_key = (self.bits, self.total_points)
+                if child_key in seen:  # Same position as an earlier sibling
+                    self.undo_move(token)
+                    continue
+                seen.add(child_key)
+                evaluation, _ = self.minimax(depth-1, alpha, beta, False)
+                self.undo_move(token)
                 
                 if evaluation > max_eval:
                     max_eval = evaluation
@@ -285,13 +440,19 @@ class GameState:
                 if beta <= alpha:
                     break
             
+            self.store_tt(tt_key, depth, max_eval, best_move, alpha_orig, beta_orig)
             return max_eval, best_move
         else:
             min_eval = math.inf
-            for move in self.get_possible_moves():
-                new_state = self.clone()
-                new_state.make_move(move[1], move[0])
-                evaluation, _ = new_state.minimax(depth-1, alpha, beta, True)
+            for move in moves:
+                token = self.do_move(move[1], move[0])
+                child_key = (self.bits, self.total_points)
+                if child_key in seen:  # Same position as an earlier sibling
+                    self.undo_move(token)
+                    continue
+                seen.add(child_key)
+                evaluation, _ = self.minimax(depth-1, alpha, beta, True)
+                self.undo_move(token)
                 
                 if evaluation < min_eval:
                     min_eval = evaluation
@@ -301,8 +462,58 @@ class GameState:
                 if beta <= alpha:
                     break
             
+            self.store_tt(tt_key, depth, min_eval, best_move, alpha_orig, beta_orig)
             return min_eval, best_move
 
+    def move_scorer(self):
+        """Return a function scoring each move by its predicted heuristic change.
+
+        Adding 2 * total_points + 0.5 * (2n - 3) to a move's score gives the exact
+        heuristic of the resulting (non-terminal) state.
+        """
+        numbers = self.numbers_list
+        odd = self.count_odd()
+        new_parity = (self.total_points + 1) % 2  # Every move flips points parity
+        new_length = self.n - 1
+
+        def predicted_score(move):
+            move_type, i = move
+            if move_type == "merge":
+                # Two odd numbers merge into an even one; otherwise the odd count holds
+                new_odd = odd - 2 * (numbers[i] & numbers[i + 1] & 1)
+                points_delta = 2
+            else:
+                new_odd = odd - (numbers[i] & 1)
+                points_delta = -2
+            matching = new_odd if new_parity else new_length - new_odd
+            return points_delta + 1.5 * matching
+
+        return predicted_score
+
+    def order_moves(self, moves, maximizing_player, first_move=None):
+        """Return moves sorted by their predicted heuristic change, best first."""
+        moves = sorted(moves, key=self.move_scorer(), reverse=maximizing_player)
+        if first_move in moves:
+            moves.remove(first_move)
+            moves.insert(0, first_move)
+        return moves
+
+    def store_tt(self, tt_key, depth, value, best_move, alpha, beta):
+        """Store a search result with its bound type in the transposition table."""
+        entry = TT.get(tt_key)
+        if entry and entry[0] > depth:
+            return  # Keep the deeper search's result
+        if len(TT) >= TT_MAX_ENTRIES:
+            TT.clear()
+
+        if value <= alpha:
+            flag = TT_UPPER
+        elif value >= beta:
+            flag = TT_LOWER
+        else:
+            flag = TT_EXACT
+        TT[tt_key] = (depth, value, best_move, flag)
+
     def ai_move(self):
         """AI makes a move using the current strategy."""
         if self.winner:
@@ -310,14 +521,36 @@ class GameState:
         
         self.ai_thoughts = ["AI is thinking..."]
         
-        if ai_mode == 'minimax':
-            # Use iterative deepening for better move selection
+        # Search deeper as the board shrinks; short endgames are solved exactly
+        if self.n <= FULL_SOLVE_LENGTH:
+            max_depth = self.n - 1
+        else:
+            max_depth = min(SEARCH_DEPTH, self.n - 1)
+
+        if ai_mode == 'minimax' and HAVE_NUMBA:
+            best_move = self.numba_search(max_depth)
+            if DEBUG_THOUGHTS:
+                self.ai_thoughts.append(f"Depth {max_depth} (compiled): Best move {best_move}")
+
+        elif ai_mode == 'minimax':
+            # Use iterative deepening for better move selection; the TT is kept
+            # between iterations and each one starts from the previous best move
             best_move = None
-            for depth in range(1, 5):  # Search up to depth 4
-                _, current_move = self.minimax(depth, -math.inf, math.inf, True)
-                if current_move:
-                    best_move = current_move
-                    self.ai_thoughts.append(f"Depth {depth}: Best move {best_move}")
+            saved = self.snapshot()
+            self._deadline = time.perf_counter() + SEARCH_TIME_LIMIT
+            try:
+                for depth in range(1, max_depth + 1):
+                    _, current_move = self.minimax(depth, -math.inf, math.inf, True, best_move)
+                    if current_move:
+                        best_move = current_move
+                        if DEBUG_THOUGHTS:
+                            self.ai_thoughts.append(f"Depth {depth}: Best move {best_move}")
+            except SearchTimeout:
+                # Keep the last completed depth and drop the interrupted search's moves
+                self.restore(saved)
+                self.ai_thoughts.append(f"Out of time at depth {depth}")
+            finally:
+                self._deadline = math.inf
 
         
         if best_move:
@@ -326,107 +559,386 @@ class GameState:
             self.make_move(index, move_type)
             self.last_ai_move = f"AI did: {move_type} at position {index}"
 
+            if DEBUG_THOUGHTS:
+                # Explain the chosen position once, rather than at every search leaf
+                self._log_thoughts = True
+                self.evaluate_heuristic()
+                self._log_thoughts = False
+            else:
+                self.ai_thoughts.append(f"Total heuristic score: {self.evaluate_heuristic()}")
+
+    def numba_search(self, max_depth):
+        """Search with the compiled kernel and return the best (move_type, index)."""
+        board = np.zeros(MAX_LENGTH, dtype=np.int8)
+        board[:self.n] = self.numbers_list
+        move_code, index = nb_best_move(board, self.n, self.total_points,
+                                        self.starting_player, max_depth)
+        if move_code < 0:
+            return None
+        return (MOVE_CODES[move_code], int(index))
+
+# Compiled search kernel: the board is an int8 buffer whose first n entries are in play.
+# Moves are applied and undone by shifting within that one buffer, and the search keeps
+# its per-ply state in arrays allocated once per search rather than recursing, which also
+# lets Numba cache every kernel on disk. The count of odd numbers is carried down so no
+# node rescans the board. Moves are tried in index order rather than sorted as in
+# GameState.order_moves, so scores match the Python search but ties between equally
+# good moves can be settled on a different move.
+MOVE_CODES = ("merge", "remove")
+
+def warm_up_search():
+    """Compile the search kernel up front so the first AI move is not delayed"""
+    if HAVE_NUMBA:
+        GameState(0, [1, 2, 3]).numba_search(2)
+
+@njit(cache=True, nogil=True)
+def nb_evaluate(board, n, points, odd, starting_player):
+    """Same scoring as GameState.evaluate_heuristic"""
+    if n == 1:
+        final_num = board[0]
+        if final_num % 2 == points & 1:
+            if (final_num % 2 == 0 and starting_player == 1) or \
+               (final_num % 2 == 1 and starting_player == 2):
+                return 1000.0
+            return -1000.0
+        return 0.0
+
+    matching = odd if points & 1 else n - odd
+    return 2.0 * points + 0.5 * (2 * n - 1) + 1.5 * matching
+
+@njit(cache=True, nogil=True)
+def nb_best_child(board, n, points, odd, maximizing_player):
+    """Score every child of a node whose children are all non-terminal"""
+    new_parity = (points + 1) & 1
+    base = 2.0 * points + 0.5 * (2 * n - 3)
+
+    best_eval = -math.inf if maximizing_player else math.inf
+    best_code = -1
+    best_index = -1
+    for move_code in range(2):
+        for i in range(n - 1 + move_code):
+            if move_code == 0:
+                new_odd = odd - 2 * (board[i] & board[i + 1] & 1)
+                evaluation = base + 2.0
+            else:
+                new_odd = odd - (board[i] & 1)
+                evaluation = base - 2.0
+            matching = new_odd if new_parity else n - 1 - new_odd
+            evaluation += 1.5 * matching
+            if (maximizing_player and evaluation > best_eval) or \
+               (not maximizing_player and evaluation < best_eval):
+                best_eval, best_code, best_index = evaluation, move_code, i
+    return best_eval, best_code, best_index
+
+@njit(cache=True, nogil=True)
+def nb_undo(board, n, move_code, i, num1, num2):
+    """Undo a move at i on a board that had n numbers before it"""
+    if move_code == 0:
+        for j in range(n - 1, i + 1, -1):
+            board[j] = board[j - 1]
+        board[i + 1] = num2
+    else:
+        for j in range(n - 1, i, -1):
+            board[j] = board[j - 1]
+    board[i] = num1
+
+@njit(cache=True, nogil=True)
+def nb_minimax(board, n, points, odd, starting_player, depth, alpha, beta, maximizing_player):
+    """Alpha-beta search over the buffer, applying and undoing moves in place.
+
+    The recursion is unrolled onto per-ply arrays: entry p of each array belongs to
+    the node p plies below the root, so the whole search runs in one call.
+    """
+    if depth == 0 or n == 1:
+        return nb_evaluate(board, n, points, odd, starting_player), -1, -1
+
+    if depth == 1 and n > 2:
+        return nb_best_child(board, n, points, odd, maximizing_player)
+
+    # Only nodes with at least one ply below them go on the stack
+    node_n = np.empty(depth, dtype=np.int64)
+    node_points = np.empty(depth, dtype=np.int64)
+    node_odd = np.empty(depth, dtype=np.int64)
+    node_alpha = np.empty(depth, dtype=np.float64)
+    node_beta = np.empty(depth, dtype=np.float64)
+    node_best = np.empty(depth, dtype=np.float64)
+    node_code = np.empty(depth, dtype=np.int64)  # Best move found so far
+    node_index = np.empty(depth, dtype=np.int64)
+    move_code = np.empty(depth, dtype=np.int64)  # Move currently being searched
+    move_index = np.empty(depth, dtype=np.int64)
+    move_num1 = np.empty(depth, dtype=np.int8)  # Numbers the move overwrote
+    move_num2 = np.empty(depth, dtype=np.int8)
+
+    ply = 0
+    node_n[0], node_points[0], node_odd[0] = n, points, odd
+    node_alpha[0], node_beta[0] = alpha, beta
+    while True:
+        # A node has just been entered: no move tried yet
+        maximizing = maximizing_player == (ply % 2 == 0)
+        node_best[ply] = -math.inf if maximizing else math.inf
+        node_code[ply] = -1
+        node_index[ply] = -1
+        move_code[ply] = 0  # Merges first, then removes
+        move_index[ply] = -1
+
+        while True:
+            # Find the node's next move
+            cur_n = node_n[ply]
+            code = move_code[ply]
+            i = move_index[ply] + 1
+            while True:
+                if i >= cur_n - 1 + code:
+                    if code == 0:
+                        code, i = 1, 0
+                        continue
+                    break
+                # Skip moves that give the same board as the move at i - 1: removing
+                # a repeated number, or merging either side of a 6 (x+6 wraps to x)
+                if i > 0 and ((code == 1 and board[i] == board[i - 1]) or
+                              (code == 0 and board[i] == 6)):
+                    i += 1
+                    continue
+                break
+
+            if i < cur_n - 1 + code:
+                # Apply it and either score the child here or descend into it
+                move_code[ply], move_index[ply] = code, i
+                num1 = board[i]
+                num2 = board[i + 1] if code == 0 else 0
+                move_num1[ply], move_num2[ply] = num1, num2
+                if code == 0:
+                    board[i] = (num1 + num2 - 1) % 6 + 1
+                    for j in range(i + 1, cur_n - 1):
+                        board[j] = board[j + 1]
+                    child_points = node_points[ply] + 1
+                    child_odd = node_odd[ply] - 2 * (num1 & num2 & 1)
+                else:
+                    for j in range(i, cur_n - 1):
+                        board[j] = board[j + 1]
+                    child_points = node_points[ply] - 1
+                    child_odd = node_odd[ply] - (num1 & 1)
+
+                child_n = cur_n - 1
+                child_depth = depth - ply - 1
+                if child_depth == 0 or child_n == 1:
+                    evaluation = nb_evaluate(board, child_n, child_points, child_odd,
+                                             starting_player)
+                elif child_depth == 1 and child_n > 2:
+                    evaluation, _, _ = nb_best_child(board, child_n, child_points, child_odd,
+                                                     not maximizing)
+                else:
+                    ply += 1
+                    node_n[ply], node_points[ply], node_odd[ply] = child_n, child_points, child_odd
+                    node_alpha[ply], node_beta[ply] = node_alpha[ply - 1], node_beta[ply - 1]
+                    break
+                parent = ply
+            else:
+                # Every move searched: hand this node's result to its parent
+                if ply == 0:
+                    return node_best[0], node_code[0], node_index[0]
+                evaluation = node_best[ply]
+                parent = ply - 1
+
+            # Undo the parent's move and fold the child's score in, passing cutoffs
+            # further up until a node still has moves to search
+            while True:
+                nb_undo(board, node_n[parent], move_code[parent], move_index[parent],
+                        move_num1[parent], move_num2[parent])
+                if maximizing_player == (parent % 2 == 0):
+                    if evaluation > node_best[parent]:
+                        node_best[parent] = evaluation
+                        node_code[parent] = move_code[parent]
+                        node_index[parent] = move_index[parent]
+                    node_alpha[parent] = max(node_alpha[parent], evaluation)
+                else:
+                    if evaluation < node_best[parent]:
+                        node_best[parent] = evaluation
+                        node_code[parent] = move_code[parent]
+                        node_index[parent] = move_index[parent]
+                    node_beta[parent] = min(node_beta[parent], evaluation)
+                if node_beta[parent] > node_alpha[parent]:
+                    break
+                if parent == 0:
+                    return node_best[0], node_code[0], node_index[0]
+                evaluation = node_best[parent]
+                parent -= 1
+            ply = parent
+            maximizing = maximizing_player == (ply % 2 == 0)
+
+@njit(cache=True, nogil=True)
+def nb_best_move(board, n, points, starting_player, max_depth):
+    """Return (move_code, index) of the AI's best move, or (-1, -1) if none"""
+    odd = 0
+    for i in range(n):
+        odd += board[i] & 1
+    _, move_code, index = nb_minimax(board, n, points, odd, starting_player, max_depth,
+                                     -math.inf, math.inf, True)
+    return move_code, index
+
 def draw_game():
     """Draw the game state on the screen (without tree visualization)"""
-    screen.fill(COLORS['white'])
-    
+    global button_spacing
+    # Only regions whose contents changed since the last frame are repainted
+    dirty_rects = []
+    if last_drawn.get('size') != (WIDTH, HEIGHT):
+        last_drawn.clear()
+        last_drawn['size'] = (WIDTH, HEIGHT)
+        screen.fill(COLORS['white'])
+        dirty_rects.append(screen.get_rect())
+
     # Draw numbers board
-    num_count = len(game_state.numbers_list)
-    available_width = screen.get_width() - (2 * PADDING)
-    button_spacing = min(BUTTON_SIZE, available_width // max(1, num_count))
-
-    for i, num in enumerate(game_state.numbers_list):
-        x = PADDING + i * button_spacing
-        y = HEIGHT // 2
-        color = COLORS['green'] if i == selected_index else COLORS['blue']
-        pygame.draw.rect(screen, color, (x, y, BUTTON_SIZE, BUTTON_SIZE))
-        text = font.render(str(num), True, COLORS['white'])
-        screen.blit(text, (x + BUTTON_SIZE // 3, y + BUTTON_SIZE // 3))
+    board_state = (game_state.bits, game_state.n, selected_index)
+    if last_drawn.get('board') != board_state:
+        last_drawn['board'] = board_state
+        board_rect = pygame.Rect(0, HEIGHT // 2, WIDTH, BUTTON_SIZE)
+        screen.fill(COLORS['white'], board_rect)
+
+        num_count = game_state.n
+        available_width = WIDTH - (2 * PADDING)
+        button_spacing = max(1, min(BUTTON_SIZE, available_width // max(1, num_count)))
+
+        for i, num in enumerate(game_state.numbers_list):
+            x = PADDING + i * button_spacing
+            y = HEIGHT // 2
+            color = COLORS['green'] if i == selected_index else COLORS['blue']
+            pygame.draw.rect(screen, color, (x, y, BUTTON_SIZE, BUTTON_SIZE))
+            screen.blit(DIGIT_SURF[num], (x + BUTTON_SIZE // 3, y + BUTTON_SIZE // 3))
+        dirty_rects.append(board_rect)
 
     # Game info panel
-    pygame.draw.rect(screen, COLORS['black'], (0, 0, WIDTH, 150), 2)
-    
-    # Score and turn info
-    score_text = font.render(f"Points: {game_state.total_points}", True, COLORS['black'])
-    screen.blit(score_text, (20, 20))
-
-    if game_state.winner:
-        turn_text = font.render(game_state.winner, True, COLORS['red'])
-    else:
-        turn_text = font.render("Your Turn" if player_turn else "AI Thinking...", 
-                              True, COLORS['green'] if player_turn else COLORS['red'])
-    screen.blit(turn_text, (WIDTH - 200, 20))
-
-    # Last AI move
-    if game_state.last_ai_move:
-        move_text = font.render(f"Last AI Move: {game_state.last_ai_move}", True, COLORS['orange'])
-        screen.blit(move_text, (20, 60))
+    header_state = (game_state.total_points, game_state.winner, player_turn,
+                    game_state.last_ai_move, game_state.last_move)
+    if last_drawn.get('header') != header_state:
+        last_drawn['header'] = header_state
+        header_rect = pygame.Rect(0, 0, WIDTH, HEIGHT // 2)
+        screen.fill(COLORS['white'], header_rect)
+        pygame.draw.rect(screen, COLORS['black'], (0, 0, WIDTH, 150), 2)
         
-        # Detailed move info
-        for i, detail in enumerate(game_state.last_move_details):
-            detail_text = small_font.render(detail, True, COLORS['purple'])
-            screen.blit(detail_text, (20, 90 + i * 20))
-
-    # Action buttons
-    pygame.draw.rect(screen, COLORS['red'], (WIDTH // 2 - 100, HEIGHT - 100, 80, 40))
-    pygame.draw.rect(screen, COLORS['green'], (WIDTH // 2 + 20, HEIGHT - 100, 80, 40))
-    screen.blit(font.render("Remove", True, COLORS['white']), (WIDTH // 2 - 90, HEIGHT - 90))
-    screen.blit(font.render("Merge", True, COLORS['white']), (WIDTH // 2 + 30, HEIGHT - 90))
-
-    # Restart button (visible when game ends)
-    if game_state.winner:
-        pygame.draw.rect(screen, COLORS['purple'], (WIDTH // 2 - 60, HEIGHT - 50, 120, 40))
-        screen.blit(font.render("Restart", True, COLORS['white']), (WIDTH // 2 - 50, HEIGHT - 40))
-
-    # AI mode toggle button
-    pygame.draw.rect(screen, COLORS['orange'], (WIDTH - 150, HEIGHT - 50, 140, 40))
-    mode_text = font.render(f"AI: {ai_mode}", True, COLORS['white'])
-    screen.blit(mode_text, (WIDTH - 140, HEIGHT - 40))
+        # Score and turn info
+        score_text = score_labels.get(game_state.total_points)
+        if score_text is None:
+            score_text = score_labels[game_state.total_points] = \
+                font.render(f"Points: {game_state.total_points}", True, COLORS['black'])
+        screen.blit(score_text, (20, 20))
+
+        if game_state.winner:
+            turn_text = font.render(game_state.winner, True, COLORS['red'])
+        else:
+            turn_text = LABEL_YOUR_TURN if player_turn else LABEL_AI_THINKING
+        screen.blit(turn_text, (WIDTH - 200, 20))
 
-    pygame.display.flip()
+        # Last AI move
+        if game_state.last_ai_move:
+            move_text = font.render(f"Last AI Move: {game_state.last_ai_move}", True, COLORS['orange'])
+            screen.blit(move_text, (20, 60))
+            
+            # Detailed move info
+            for i, detail in enumerate(game_state.move_details()):
+                detail_text = small_font.render(detail, True, COLORS['purple'])
+                screen.blit(detail_text, (20, 90 + i * 20))
+        dirty_rects.append(header_rect)
+
+    # Buttons along the bottom
+    buttons_state = (bool(game_state.winner), ai_mode)
+    if last_drawn.get('buttons') != buttons_state:
+        last_drawn['buttons'] = buttons_state
+        buttons_rect = pygame.Rect(0, HEIGHT - 100, WIDTH, 100)
+        screen.fill(COLORS['white'], buttons_rect)
+
+        # Action buttons
+        pygame.draw.rect(screen, COLORS['red'], (WIDTH // 2 - 100, HEIGHT - 100, 80, 40))
+        pygame.draw.rect(screen, COLORS['green'], (WIDTH // 2 + 20, HEIGHT - 100, 80, 40))
+        screen.blit(LABEL_REMOVE, (WIDTH // 2 - 90, HEIGHT - 90))
+        screen.blit(LABEL_MERGE, (WIDTH // 2 + 30, HEIGHT - 90))
+
+        # Restart button (visible when game ends)
+        if game_state.winner:
+            pygame.draw.rect(screen, COLORS['purple'], (WIDTH // 2 - 60, HEIGHT - 50, 120, 40))
+            screen.blit(LABEL_RESTART, (WIDTH // 2 - 50, HEIGHT - 40))
+
+        # AI mode toggle button
+        pygame.draw.rect(screen, COLORS['orange'], (WIDTH - 150, HEIGHT - 50, 140, 40))
+        mode_text = mode_labels.get(ai_mode)
+        if mode_text is None:
+            mode_text = mode_labels[ai_mode] = font.render(f"AI: {ai_mode}", True, COLORS['white'])
+        screen.blit(mode_text, (WIDTH - 140, HEIGHT - 40))
+        dirty_rects.append(buttons_rect)
+
+    if dirty_rects:
+        pygame.display.update(dirty_rects)
 
 def initialize_game():
     """Initialize a new game"""
     global game_state, player_turn, selected_index, game_tree
     
-    initial_length = random.randint(15, 25)
-    starting_numbers = [random.randint(1, 6) for _ in range(initial_length)]
+    initial_length = rng.randint(15, 25)
+    starting_numbers = rng.choices(range(1, 7), k=initial_length)
     game_state = GameState(total_points=0, numbers_list=starting_numbers)
     player_turn = True  # Player goes first
     selected_index = None
+    TT.clear()
     
     # Initialize game tree
     game_tree.start_new_game(game_state)
 
+def run_ai_search(state, done):
+    """Thread body: let the AI choose and play its move on state, then set done"""
+    try:
+        state.ai_move()
+    finally:
+        done.set()
+
 # Initialize the game and tree
-game_tree = GameTree()
+game_tree = GameTree(enabled=not args.no_tree)
 initialize_game()
+draw_game()  # Show the board while the search kernel compiles
+warm_up_search()
+
+clock = pygame.time.Clock()
+last_input_time = pygame.time.get_ticks()
+ai_move_at = 0  # Tick at which the AI takes its turn
+ai_state = None  # Copy of the game the AI is searching on its own thread
+ai_done = threading.Event()
 
 running = True
 while running:
     draw_game()
     
-    # AI's turn
-    if not player_turn and not game_state.winner:
-        pygame.time.delay(500)  # Small delay so player can see AI's move
-        game_state.ai_move()
-        
+    # AI's turn, once the player has had a moment to see their own move. The search
+    # runs on a copy in the background so the window keeps redrawing and handling events
+    if not player_turn and not game_state.winner and ai_state is None and \
+       pygame.time.get_ticks() >= ai_move_at:
+        ai_state = game_state.clone()
+        ai_done.clear()
+        threading.Thread(target=run_ai_search, args=(ai_state, ai_done), daemon=True).start()
+
+    elif ai_state is not None and ai_done.is_set():
+        game_state, ai_state = ai_state, None
+
         # Record AI move in game tree
         if game_state.last_ai_move:
-            last_action = game_state.last_move_details[0].split(":")[0].lower()
-            last_index = int(game_state.last_move_details[0].split(":")[1].strip())
-            game_tree.add_node((last_action, last_index), game_state)
+            move_type, index = game_state.last_move[:2]
+            game_tree.add_node((move_type, index), game_state)
         
         player_turn = True
 
     for event in pygame.event.get():
+        if event.type in (pygame.MOUSEMOTION, pygame.MOUSEBUTTONDOWN):
+            last_input_time = pygame.time.get_ticks()
+
         if event.type == pygame.QUIT:
             game_tree.save_tree()  # Save tree before quitting
             running = False
         
+        if event.type == pygame.VIDEOEXPOSE:
+            last_drawn.clear()  # Window contents were lost; repaint everything
+
         if event.type == pygame.VIDEORESIZE:
             WIDTH, HEIGHT = event.w, event.h
-            screen = pygame.display.set_mode((WIDTH, HEIGHT), pygame.RESIZABLE)
+            # pygame 2 resizes a RESIZABLE window's surface itself, so the display
+            # is only recreated if the surface did not follow the window
+            if screen.get_size() != (WIDTH, HEIGHT):
+                screen = pygame.display.set_mode((WIDTH, HEIGHT), pygame.RESIZABLE)
 
         if event.type == pygame.MOUSEBUTTONDOWN:
             x, y = pygame.mouse.get_pos()
@@ -440,34 +952,37 @@ while running:
                 continue
             
             if player_turn and not game_state.winner:
-                # Select a number
-                button_spacing = min(BUTTON_SIZE, (screen.get_width() - 2*PADDING) // max(1, len(game_state.numbers_list)))
-                for i in range(len(game_state.numbers_list)):
-                    btn_x = PADDING + i * button_spacing
-                    btn_y = HEIGHT // 2
-                    if btn_x <= x <= btn_x + BUTTON_SIZE and btn_y <= y <= btn_y + BUTTON_SIZE:
-                        selected_index = i
+                # Select a number; where buttons overlap, the rightmost one is on top
+                i = min((x - PADDING) // button_spacing, game_state.n - 1)
+                btn_x = PADDING + i * button_spacing
+                btn_y = HEIGHT // 2
+                if i >= 0 and btn_x <= x <= btn_x + BUTTON_SIZE and btn_y <= y <= btn_y + BUTTON_SIZE:
+                    selected_index = i
 
                 # Check action buttons
                 if selected_index is not None:
                     # Remove action
                     if WIDTH // 2 - 100 <= x <= WIDTH // 2 - 20 and HEIGHT - 100 <= y <= HEIGHT - 60:
-                        if len(game_state.numbers_list) > 1:  # Prevent removing last number
-                            prev_state = game_state.clone()
+                        if game_state.n > 1:  # Prevent removing last number
                             game_state.make_move(selected_index, "remove")
                             player_turn = False
+                            ai_move_at = pygame.time.get_ticks() + AI_MOVE_DELAY_MS
                             # Record move in game tree
-                            game_tree.add_node(("remove", selected_index), prev_state)
+                            game_tree.add_node(("remove", selected_index), game_state)
                             selected_index = None
 
                     # Merge action
                     elif WIDTH // 2 + 20 <= x <= WIDTH // 2 + 100 and HEIGHT - 100 <= y <= HEIGHT - 60:
-                        if selected_index < len(game_state.numbers_list) - 1:  # Must have pair
-                            prev_state = game_state.clone()
+                        if selected_index < game_state.n - 1:  # Must have pair
                             game_state.make_move(selected_index, "merge")
                             player_turn = False
+                            ai_move_at = pygame.time.get_ticks() + AI_MOVE_DELAY_MS
                             # Record move in game tree
-                            game_tree.add_node(("merge", selected_index), prev_state)
+                            game_tree.add_node(("merge", selected_index), game_state)
                             selected_index = None
 
+    # Cap the frame rate, dropping it further while the player is idle
+    idle = player_turn and pygame.time.get_ticks() - last_input_time > IDLE_AFTER_MS
+    clock.tick(IDLE_FPS if idle else FPS)
+
 pygame.quit()